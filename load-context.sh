@@ -14,8 +14,8 @@ if [ ! -f "$CONTEXT_FILE" ]; then
   exit 0
 fi
 
-# Parse workspace name
-WORKSPACE=$(grep "^workspace:" "$CONTEXT_FILE" | sed 's/^workspace: *//; s/"//g')
+# Parse workspace name (stop at first match - it sits at the top of the file)
+WORKSPACE=$(sed -n '/^workspace:/{s/^workspace: *//;s/"//g;p;q;}' "$CONTEXT_FILE")
 
 if [ -z "$WORKSPACE" ]; then
   echo "⚠️  Warning: .kb-context/context.yaml exists but workspace not defined"
@@ -28,7 +28,7 @@ echo "📍 KB Context: $WORKSPACE"
 echo "📚 Context file: $CONTEXT_FILE"
 
 # Count contexts
-CONTEXT_COUNT=$(grep -c "^  - " "$CONTEXT_FILE" | head -1)
+CONTEXT_COUNT=$(grep -c "^  - " "$CONTEXT_FILE")
 echo "📋 Loaded contexts: $CONTEXT_COUNT areas"
 
 # Export for agent awareness